@@ -3,16 +3,88 @@
 Create sample CSV data for testing the Data Analyst Agent.
 """
 
+import argparse
 import pandas as pd
 import numpy as np
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow is optional - fall back to the pandas CSV writer
+    pa = None
+    pacsv = None
+    pq = None
 
-def create_sample_sales_data():
-    """Create sample sales data CSV."""
+
+PRODUCT_NAMES = np.array([
+    'Laptop Pro', 'Gaming Mouse', 'Wireless Headphones', 'Smart Watch', 'Tablet',
+    'T-Shirt', 'Jeans', 'Sneakers', 'Dress', 'Jacket',
+    'Programming Book', 'Fiction Novel', 'Cookbook', 'History Book', 'Science Magazine',
+    'Garden Tools', 'Kitchen Appliance', 'Furniture', 'Decor Item', 'Storage Box',
+    'Running Shoes', 'Yoga Mat', 'Dumbbells', 'Tennis Racket', 'Bicycle',
+    'Skincare Set', 'Makeup Kit', 'Perfume', 'Hair Care', 'Nail Polish'
+])
+
+FIRST_NAMES = np.array(['John', 'Jane', 'Mike', 'Sarah', 'David', 'Lisa', 'Chris', 'Amy', 'Tom', 'Kate'])
+
+LAST_NAMES = np.array(['Smith', 'Johnson', 'Brown', 'Davis', 'Wilson', 'Miller', 'Moore', 'Taylor', 'Anderson', 'Thomas'])
+
+POSITIONS = np.array(['Senior Manager', 'Manager', 'Senior Analyst', 'Analyst', 'Associate', 'Specialist'])
+
+# Salary multiplier per education level, aligned by index
+EDUCATION_LEVELS = ['High School', 'Bachelor\'s', 'Master\'s', 'PhD']
+EDUCATION_MULTIPLIERS = np.array([0.8, 1.0, 1.3, 1.6])
+
+# Month (1-12) -> index into SEASONS; slot 0 is unused
+SEASONS = ['Winter', 'Spring', 'Summer', 'Fall']
+MONTH_SEASON_CODES = np.array([-1, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0])
+
+# Weekday (Monday=0) -> day name
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Low-cardinality string columns stored as pandas categoricals
+SALES_CATEGORICAL_COLUMNS = [
+    'product_category', 'customer_gender', 'sales_channel', 'payment_method', 'season', 'day_of_week'
+]
+EMPLOYEE_CATEGORICAL_COLUMNS = ['department', 'position', 'education_level']
+
+
+def optimize_dtypes(df, categorical_columns):
+    """Downcast integer columns and convert low-cardinality strings to category."""
+    # Floats stay float64: prices and amounts are not exact in float32 (32.78 -> 32.779998...)
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in categorical_columns:
+        df[col] = df[col].astype('category')
+    return df
+
+
+def build_frame(data):
+    """Build a DataFrame from column arrays, via Arrow when available to skip block consolidation."""
+    if pa is None:
+        return pd.DataFrame(data)
+    return pa.table(data).to_pandas(split_blocks=True, self_destruct=True)
+
+
+def clipped_ints(values, low, high, dtype=np.int8):
+    """Clip float draws in place and truncate them once to a narrow integer dtype."""
+    return np.clip(values, low, high, out=values).astype(dtype)
+
+
+def make_ids(prefix, n, width):
+    """Build sequential zero-padded IDs (e.g. ORD-000001) as one vectorized string op."""
+    numbers = np.arange(1, n + 1).astype('U')
+    return np.char.add(prefix, np.char.zfill(numbers, width))
+
+
+def create_sample_sales_data(seed=None):
+    """Create sample sales data CSV, drawing from the given SeedSequence (default: seed 42)."""
     
-    # Set random seed for reproducibility
-    np.random.seed(42)
+    # Seeded generator for reproducibility
+    rng = np.random.default_rng(seed if seed is not None else np.random.SeedSequence(42))
     
     # Generate 500 records of sample sales data
     n_records = 500
@@ -21,108 +93,87 @@ def create_sample_sales_data():
     dates = pd.date_range('2023-01-01', '2023-12-31', freq='D')
     
     data = {
-        'order_id': [f'ORD-{str(i).zfill(6)}' for i in range(1, n_records + 1)],
-        'date': np.random.choice(dates, n_records),
-        'product_category': np.random.choice(
+        'order_id': make_ids('ORD-', n_records, 6),
+        'date': np.sort(rng.choice(dates.to_numpy(), n_records)),  # Pre-sorted so rows come out in date order
+        'product_category': rng.choice(
             ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Beauty'], 
             n_records, 
             p=[0.25, 0.20, 0.15, 0.15, 0.15, 0.10]
         ),
-        'product_name': [
-            np.random.choice([
-                'Laptop Pro', 'Gaming Mouse', 'Wireless Headphones', 'Smart Watch', 'Tablet',
-                'T-Shirt', 'Jeans', 'Sneakers', 'Dress', 'Jacket',
-                'Programming Book', 'Fiction Novel', 'Cookbook', 'History Book', 'Science Magazine',
-                'Garden Tools', 'Kitchen Appliance', 'Furniture', 'Decor Item', 'Storage Box',
-                'Running Shoes', 'Yoga Mat', 'Dumbbells', 'Tennis Racket', 'Bicycle',
-                'Skincare Set', 'Makeup Kit', 'Perfume', 'Hair Care', 'Nail Polish'
-            ]) for _ in range(n_records)
-        ],
-        'price': np.round(np.random.lognormal(3.5, 0.8, n_records), 2),  # Log-normal distribution for realistic prices
-        'quantity': np.random.randint(1, 10, n_records),
-        'customer_age': np.random.normal(40, 15, n_records).astype(int).clip(18, 80),
-        'customer_gender': np.random.choice(['Male', 'Female', 'Other'], n_records, p=[0.45, 0.50, 0.05]),
-        'sales_channel': np.random.choice(['Online', 'In-Store', 'Mobile App'], n_records, p=[0.50, 0.35, 0.15]),
-        'payment_method': np.random.choice(['Credit Card', 'Debit Card', 'PayPal', 'Cash'], n_records, p=[0.40, 0.30, 0.20, 0.10]),
-        'discount_applied': np.random.choice([True, False], n_records, p=[0.30, 0.70]),
-        'customer_satisfaction': np.round(np.random.normal(4.0, 0.8, n_records).clip(1, 5), 1)
+        'product_name': rng.choice(PRODUCT_NAMES, n_records),
+        'price': np.round(rng.lognormal(3.5, 0.8, n_records), 2),  # Log-normal distribution for realistic prices
+        'quantity': rng.integers(1, 10, size=n_records),
+        'customer_age': clipped_ints(rng.normal(40, 15, n_records), 18, 80),
+        'customer_gender': rng.choice(['Male', 'Female', 'Other'], n_records, p=[0.45, 0.50, 0.05]),
+        'sales_channel': rng.choice(['Online', 'In-Store', 'Mobile App'], n_records, p=[0.50, 0.35, 0.15]),
+        'payment_method': rng.choice(['Credit Card', 'Debit Card', 'PayPal', 'Cash'], n_records, p=[0.40, 0.30, 0.20, 0.10]),
+        'discount_applied': rng.choice([True, False], n_records, p=[0.30, 0.70]),
+        'customer_satisfaction': np.round(rng.normal(4.0, 0.8, n_records).clip(1, 5), 1)
     }
     
-    df = pd.DataFrame(data)
+    df = build_frame(data)
     
-    # Add calculated fields
-    df['discount_amount'] = np.where(
-        df['discount_applied'], 
-        np.round(df['price'] * df['quantity'] * np.random.uniform(0.05, 0.25, n_records), 2),
-        0.0
-    )
-    df['total_amount'] = np.round(df['price'] * df['quantity'] - df['discount_amount'], 2)
+    # Add calculated fields (discount rates are only drawn for discounted orders)
+    price = df['price'].to_numpy()
+    quantity = df['quantity'].to_numpy()
+    discounted = df['discount_applied'].to_numpy()
+    gross = price * quantity
+    discount_amount = np.zeros(n_records)
+    discount_amount[discounted] = np.round(gross[discounted] * rng.uniform(0.05, 0.25, discounted.sum()), 2)
+    df['discount_amount'] = discount_amount
+    df['total_amount'] = np.round(gross - discount_amount, 2)
     
     # Add some seasonal patterns
-    df['month'] = df['date'].dt.month
-    df['season'] = df['month'].map({
-        12: 'Winter', 1: 'Winter', 2: 'Winter',
-        3: 'Spring', 4: 'Spring', 5: 'Spring',
-        6: 'Summer', 7: 'Summer', 8: 'Summer',
-        9: 'Fall', 10: 'Fall', 11: 'Fall'
-    })
+    months = df['date'].dt.month.to_numpy()
+    df['month'] = months
+    df['season'] = pd.Categorical.from_codes(MONTH_SEASON_CODES[months], categories=SEASONS)
     
     # Add day of week
-    df['day_of_week'] = df['date'].dt.day_name()
-    df['is_weekend'] = df['date'].dt.weekday >= 5
+    weekdays = df['date'].dt.weekday.to_numpy()
+    df['day_of_week'] = pd.Categorical.from_codes(weekdays, categories=DAY_NAMES)
+    df['is_weekend'] = weekdays >= 5
     
     # Introduce some realistic missing values (about 3% of satisfaction scores)
-    missing_indices = np.random.choice(df.index, size=int(0.03 * len(df)), replace=False)
-    df.loc[missing_indices, 'customer_satisfaction'] = np.nan
+    # (Arrow-backed columns are read-only, so mask into a new column instead of assigning in place)
+    missing = np.zeros(n_records, dtype=bool)
+    missing[rng.choice(n_records, size=int(0.03 * n_records), replace=False)] = True
+    df['customer_satisfaction'] = df['customer_satisfaction'].mask(missing)
     
-    # Sort by date
-    df = df.sort_values('date').reset_index(drop=True)
-    
-    return df
+    return optimize_dtypes(df, SALES_CATEGORICAL_COLUMNS)
 
 
-def create_sample_employee_data():
-    """Create sample employee data CSV."""
+def create_sample_employee_data(seed=None):
+    """Create sample employee data CSV, drawing from the given SeedSequence (default: seed 123)."""
     
-    np.random.seed(123)
+    rng = np.random.default_rng(seed if seed is not None else np.random.SeedSequence(123))
     n_employees = 200
     
     data = {
-        'employee_id': [f'EMP-{str(i).zfill(4)}' for i in range(1, n_employees + 1)],
-        'first_name': [
-            np.random.choice(['John', 'Jane', 'Mike', 'Sarah', 'David', 'Lisa', 'Chris', 'Amy', 'Tom', 'Kate']) 
-            for _ in range(n_employees)
-        ],
-        'last_name': [
-            np.random.choice(['Smith', 'Johnson', 'Brown', 'Davis', 'Wilson', 'Miller', 'Moore', 'Taylor', 'Anderson', 'Thomas']) 
-            for _ in range(n_employees)
-        ],
-        'department': np.random.choice(
+        'employee_id': make_ids('EMP-', n_employees, 4),
+        'first_name': rng.choice(FIRST_NAMES, n_employees),
+        'last_name': rng.choice(LAST_NAMES, n_employees),
+        'department': rng.choice(
             ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance', 'Operations'], 
             n_employees, 
             p=[0.30, 0.25, 0.15, 0.10, 0.10, 0.10]
         ),
-        'position': [
-            np.random.choice([
-                'Senior Manager', 'Manager', 'Senior Analyst', 'Analyst', 'Associate', 'Specialist'
-            ]) for _ in range(n_employees)
-        ],
-        'hire_date': pd.to_datetime(np.random.choice(
+        'position': rng.choice(POSITIONS, n_employees),
+        'hire_date': pd.to_datetime(rng.choice(
             pd.date_range('2018-01-01', '2023-12-31'), n_employees
         )),
-        'salary': np.round(np.random.normal(75000, 25000, n_employees).clip(40000, 200000), 0),
-        'age': np.random.normal(35, 10, n_employees).astype(int).clip(22, 65),
-        'years_experience': np.random.normal(8, 5, n_employees).astype(int).clip(0, 40),
-        'education_level': np.random.choice(
-            ['High School', 'Bachelor\'s', 'Master\'s', 'PhD'], 
+        'salary': np.round(rng.normal(75000, 25000, n_employees).clip(40000, 200000), 0),
+        'age': clipped_ints(rng.normal(35, 10, n_employees), 22, 65),
+        'years_experience': clipped_ints(rng.normal(8, 5, n_employees), 0, 40),
+        'education_level': rng.choice(
+            EDUCATION_LEVELS, 
             n_employees, 
             p=[0.10, 0.50, 0.35, 0.05]
         ),
-        'performance_rating': np.round(np.random.normal(3.5, 0.7, n_employees).clip(1, 5), 1),
-        'is_remote': np.random.choice([True, False], n_employees, p=[0.40, 0.60])
+        'performance_rating': np.round(rng.normal(3.5, 0.7, n_employees).clip(1, 5), 1),
+        'is_remote': rng.choice([True, False], n_employees, p=[0.40, 0.60])
     }
     
-    df = pd.DataFrame(data)
+    df = build_frame(data)
     
     # Add calculated fields
     df['years_at_company'] = (pd.Timestamp.now() - df['hire_date']).dt.days / 365.25
@@ -130,38 +181,68 @@ def create_sample_employee_data():
     
     # Introduce some correlations for more realistic data
     # Higher education generally correlates with higher salary
-    education_multipliers = {
-        'High School': 0.8,
-        'Bachelor\'s': 1.0,
-        'Master\'s': 1.3,
-        'PhD': 1.6
-    }
-    df['salary'] = df.apply(lambda row: row['salary'] * education_multipliers[row['education_level']], axis=1)
-    df['salary'] = df['salary'].round(0)
+    education_levels = pd.Categorical(df['education_level'], categories=EDUCATION_LEVELS)
+    # Whole dollars, stored as integers so both CSV writers format them the same way
+    df['salary'] = np.round(df['salary'].to_numpy() * EDUCATION_MULTIPLIERS[education_levels.codes], 0).astype(np.int64)
     
-    return df
+    return optimize_dtypes(df, EMPLOYEE_CATEGORICAL_COLUMNS)
+
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV, using Arrow's multi-threaded writer when available."""
+    if pacsv is None:
+        df.to_csv(path, index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Sample dates are whole days, so write them as dates rather than full timestamps
+    schema = pa.schema([
+        field.with_type(pa.date32()) if pa.types.is_timestamp(field.type) else field
+        for field in table.schema
+    ])
+    pacsv.write_csv(table.cast(schema), path)
+
+
+def write_parquet(df, path):
+    """Write a DataFrame to a zstd-compressed Parquet file, preserving dtypes."""
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression='zstd')
 
 
 def main():
     """Create sample data files."""
     
+    parser = argparse.ArgumentParser(description="Create sample data files")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output file format (parquet requires pyarrow)"
+    )
+    args = parser.parse_args()
+    
+    if args.format == "parquet" and pq is None:
+        parser.error("--format parquet requires pyarrow to be installed")
+    write_data = write_parquet if args.format == "parquet" else write_csv
+    
     print("Creating sample data files...")
     
     # Ensure data directory exists
     os.makedirs('data', exist_ok=True)
     
-    # Create sales data
-    print("Creating sales data...")
-    sales_df = create_sample_sales_data()
-    sales_path = 'data/sample_sales_data.csv'
-    sales_df.to_csv(sales_path, index=False)
+    # Each dataset draws from an independent child seed stream. They are generated
+    # serially: at a few hundred rows, worker start-up would cost more than it saves
+    print("Creating sales and employee data...")
+    sales_seed, employee_seed = np.random.SeedSequence(42).spawn(2)
+    sales_df = create_sample_sales_data(sales_seed)
+    employee_df = create_sample_employee_data(employee_seed)
+    
+    # Save sales data
+    sales_path = f'data/sample_sales_data.{args.format}'
+    write_data(sales_df, sales_path)
     print(f"✓ Sales data saved to {sales_path} ({len(sales_df)} records)")
     
-    # Create employee data
-    print("Creating employee data...")
-    employee_df = create_sample_employee_data()
-    employee_path = 'data/sample_employee_data.csv'
-    employee_df.to_csv(employee_path, index=False)
+    # Save employee data
+    employee_path = f'data/sample_employee_data.{args.format}'
+    write_data(employee_df, employee_path)
     print(f"✓ Employee data saved to {employee_path} ({len(employee_df)} records)")
     
     print("\nSample data files created successfully!")
@@ -2,8 +2,22 @@
 Data Analyst Agent - A LangGraph-based data analysis agent using Mistral AI.
 """
 
-from .coding_agent import CodingAgent
-from .state import AgentState
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .coding_agent import CodingAgent
+    from .state import AgentState
 
 __version__ = "1.0.0"
-__all__ = ["CodingAgent", "AgentState"]
\ No newline at end of file
+__all__ = ["CodingAgent", "AgentState"]
+
+
+def __getattr__(name):
+    # Import the agent lazily so the CLI can parse arguments without loading LangChain
+    if name == "CodingAgent":
+        from .coding_agent import CodingAgent
+        return CodingAgent
+    if name == "AgentState":
+        from .state import AgentState
+        return AgentState
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,8 +2,9 @@
 Main LangGraph agent for data analysis.
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from langchain_mistralai import ChatMistralAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
@@ -14,10 +15,15 @@ from langgraph.checkpoint.memory import MemorySaver
 from .state import CodingAgentState
 from .tools import execute_python_code, get_dataframe_info, suggest_analysis_steps
 from .prompt_manager import PromptManager
-load_dotenv()
 
-MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
-MISTRAL_MODEL = os.getenv("MISTRAL_MODEL")
+
+@lru_cache(maxsize=None)
+def _load_mistral_config() -> Tuple[Optional[str], Optional[str]]:
+    """Load the .env file once and return the Mistral API key and model name."""
+    load_dotenv()
+    return os.getenv("MISTRAL_API_KEY"), os.getenv("MISTRAL_MODEL")
+
+
 class CodingAgent:
     """LangGraph-based data analyst agent using Mistral AI."""
     
@@ -28,10 +34,14 @@ class CodingAgent:
         self.prompt_manager = PromptManager()
         self.agent_type = agent_type
         
+        # Base system prompt is constant per agent type, so load it once
+        self.system_prompt = self._create_system_prompt()
+        
         # Initialize LLMs for different tasks
+        api_key, model = _load_mistral_config()
         self.llm = ChatMistralAI(
-            api_key=MISTRAL_API_KEY,
-            model = MISTRAL_MODEL,
+            api_key=api_key,
+            model = model,
             temperature = 0.7
         )
         
@@ -48,6 +58,13 @@ class CodingAgent:
         # Bind tools to LLM
         self.llm_with_tools = self.llm.bind_tools(self.tools)
         
+        # Build the prompt chain once; the system context is filled in per turn
+        self.prompt = ChatPromptTemplate.from_messages([
+            ("system", "{system_context}"),
+            MessagesPlaceholder(variable_name="messages"),
+        ])
+        self.chain = self.prompt | self.llm_with_tools
+        
         # Create the graph
         self.graph = self._create_graph()
     
@@ -99,7 +116,7 @@ class CodingAgent:
                 current_task = last_message.content
         
         # Add context about current dataframe to the system prompt
-        system_context = self._create_system_prompt()
+        system_context = self.system_prompt
         
         if state.get("csv_loaded") and state.get("csv_file_path"):
             system_context += f"\n\nCurrent CSV file: {state['csv_file_path']}"
@@ -110,20 +127,12 @@ class CodingAgent:
         if state.get("error"):
             system_context += f"\n\nPrevious error: {state['error']}"
         
-        # Update the prompt template with enhanced system context
-        enhanced_prompt = ChatPromptTemplate.from_messages([
-            ("system", system_context),
-            MessagesPlaceholder(variable_name="messages"),
-        ])
-        
-        # Create the chain with enhanced prompt
-        chain = enhanced_prompt | self.llm_with_tools
-        
         # Use only the conversation messages
         all_messages = state["messages"]
         
-        # Invoke the chain
-        response = chain.invoke({
+        # Invoke the cached chain with the enhanced system context
+        response = self.chain.invoke({
+            "system_context": system_context,
             "messages": all_messages
         })
         
@@ -142,12 +151,9 @@ class CodingAgent:
         
         last_message = state["messages"][-1]
         
-        # If the last message has tool calls, continue with tools
-        if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-            return "continue"
-        
-        # Otherwise, end the conversation
-        return "end"
+        # If the last message has tool calls, continue with tools; otherwise end
+        tool_calls = getattr(last_message, "tool_calls", None)
+        return "continue" if tool_calls else "end"
     
     # Run Graph
     def run(self, user_input: str, csv_file_path: str = None, thread_id: str = "default") -> Dict[str, Any]:
@@ -185,25 +191,19 @@ class CodingAgent:
         config = {"configurable": {"thread_id": thread_id}}
         
         try:
-            # Stream the execution
-            events = []
-            for event in self.graph.stream(initial_state, config):
-                events.append(event)
-            
-            # Get final state
-            final_state = self.graph.get_state(config)
+            # Run the graph to completion and get the final state
+            final_state = self.graph.invoke(initial_state, config)
             
             # Extract the final response
             final_response = ""
-            if final_state.values.get("messages"):
-                last_message = final_state.values["messages"][-1]
+            if final_state.get("messages"):
+                last_message = final_state["messages"][-1]
                 if isinstance(last_message, AIMessage):
                     final_response = last_message.content
             
             return {
                 "response": final_response,
-                "state": final_state.values,
-                "events": events,
+                "state": final_state,
                 "success": True
             }
             
@@ -211,7 +211,6 @@ class CodingAgent:
             return {
                 "response": f"Error occurred: {str(e)}",
                 "state": initial_state,
-                "events": [],
                 "success": False,
                 "error": str(e)
             }
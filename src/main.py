@@ -2,13 +2,23 @@
 Main interface for running the Data Analyst Agent.
 """
 
-import argparse
+import itertools
 import os
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
-from .coding_agent import CodingAgent
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    from .coding_agent import CodingAgent
+
+# Extensions the data tools read (anything else is parsed as CSV)
+DATA_FILE_EXTENSIONS = ('.csv', '.parquet')
+
+# Sequence numbers for the fresh conversation threads started by 'clear'
+_clear_sequence = itertools.count(1)
 
 
 def print_banner():
@@ -22,26 +32,35 @@ def print_banner():
     print(banner)
 
 
+@lru_cache(maxsize=None)
+def get_max_csv_size_mb() -> float:
+    """Read the MAX_CSV_SIZE_MB setting once, defaulting to 100MB."""
+    max_size_str = os.getenv("MAX_CSV_SIZE_MB", "100")  # Default to 100MB if not set
+    try:
+        return float(max_size_str)
+    except ValueError:
+        print(f"Warning: Invalid MAX_CSV_SIZE_MB value '{max_size_str}'. Using default of 100MB.")
+        return 100.0
+
+
 def validate_csv_file(file_path: str) -> bool:
-    """Validate that the CSV file exists and is readable."""
-    if not os.path.exists(file_path):
-        print(f"Error: CSV file '{file_path}' does not exist.")
+    """Validate that the data file (CSV or Parquet) exists and is readable."""
+    # A single stat call covers both the existence and the size check
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        print(f"Error: Data file '{file_path}' does not exist.")
         return False
     
-    if not file_path.lower().endswith('.csv'):
-        print(f"Warning: File '{file_path}' does not have a .csv extension.")
+    if os.path.splitext(file_path)[1].lower() not in DATA_FILE_EXTENSIONS:
+        print(f"Warning: Data file '{file_path}' does not have a .csv or .parquet extension.")
     
     # Check file size
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-    try:
-        max_size_str = os.getenv("MAX_CSV_SIZE_MB", "100")  # Default to 100MB if not set
-        max_size = float(max_size_str)
-    except ValueError:
-        print(f"Warning: Invalid MAX_CSV_SIZE_MB value '{max_size_str}'. Using default of 100MB.")
-        max_size = 100.0
+    file_size_mb = file_stat.st_size / (1024 * 1024)
+    max_size = get_max_csv_size_mb()
     
     if file_size_mb > max_size:
-        print(f"Warning: CSV file is {file_size_mb:.1f}MB, which exceeds the recommended maximum of {max_size}MB.")
+        print(f"Warning: Data file is {file_size_mb:.1f}MB, which exceeds the recommended maximum of {max_size}MB.")
         response = input("Continue anyway? (y/N): ")
         if response.lower() != 'y':
             return False
@@ -49,8 +68,16 @@ def validate_csv_file(file_path: str) -> bool:
     return True
 
 
-def interactive_mode(agent: CodingAgent, csv_file: Optional[str] = None):
+def interactive_mode(agent: "CodingAgent", csv_file: Optional[str] = None):
     """Run the agent in interactive mode."""
+    # Line editing and in-session history for input(); only loaded for interactive use.
+    # readline isn't available on every platform (e.g. Windows), so it's optional.
+    try:
+        import readline
+        readline.set_history_length(1000)
+    except ImportError:
+        pass
+    
     print("Interactive mode started. Type 'quit' or 'exit' to stop.")
     print("Type 'help' for available commands.")
     
@@ -75,7 +102,7 @@ def interactive_mode(agent: CodingAgent, csv_file: Optional[str] = None):
             
             if user_input.lower() == 'clear':
                 # Start a new thread
-                thread_id = f"interactive_session_{len(os.urandom(4).hex())}"
+                thread_id = f"interactive_session_{next(_clear_sequence)}"
                 print("Conversation history cleared.")
                 continue
             
@@ -136,7 +163,21 @@ The agent will execute pandas code to analyze your data and provide insights.
     print(help_text)
 
 
-def single_query_mode(agent: CodingAgent, query: str, csv_file: Optional[str] = None):
+def print_usage():
+    """Print command-line usage (the --help fast path, without building the argparse parser)."""
+    usage_text = """usage: python -m src.main [-h] [--csv CSV] [--query QUERY] [--verbose]
+
+Data Analyst Agent
+
+options:
+  -h, --help     show this help message and exit
+  --csv CSV      Path to CSV or Parquet file to analyze
+  --query QUERY  Single query to run (non-interactive mode)
+  --verbose      Enable verbose output"""
+    print(usage_text)
+
+
+def single_query_mode(agent: "CodingAgent", query: str, csv_file: Optional[str] = None):
     """Run a single query and exit."""
     print(f"Query: {query}")
     if csv_file:
@@ -160,11 +201,19 @@ def single_query_mode(agent: CodingAgent, query: str, csv_file: Optional[str] =
 
 def main():
     """Main entry point."""
+    # Answer --help without importing argparse or building the parser
+    argv = sys.argv[1:]
+    if '-h' in argv or '--help' in argv:
+        print_usage()
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Data Analyst Agent")
     parser.add_argument(
         "--csv", 
         type=str, 
-        help="Path to CSV file to analyze"
+        help="Path to CSV or Parquet file to analyze"
     )
     parser.add_argument(
         "--query", 
@@ -179,6 +228,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Load settings such as MAX_CSV_SIZE_MB from .env before validating input
+    load_dotenv()
+    
     # Print banner
     print_banner()
     
@@ -186,7 +238,9 @@ def main():
     if args.csv and not validate_csv_file(args.csv):
         sys.exit(1)
     
-    # Initialize the agent
+    # Initialize the agent (imported here so --help and argument errors stay fast)
+    from .coding_agent import CodingAgent
+    
     try:
         print("Initializing agent...")
         agent = CodingAgent()
@@ -6,6 +6,12 @@ import os
 from typing import Dict, Optional
 from pathlib import Path
 
+try:
+    # libyaml-backed loader parses in C; fall back to the pure-Python one if unavailable
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class PromptManager:
     """Simple manager for loading system prompts from YAML files."""
@@ -29,6 +35,23 @@ class PromptManager:
         # Cache for loaded prompts and agent metadata
         self._prompt_cache: Dict[str, str] = {}
         self._agents_metadata: Optional[Dict] = None
+        
+        # Prompt files don't change at runtime, so parse them all up front
+        self._preload()
+    
+    def _preload(self):
+        """Load every agent prompt and the agent metadata into the caches."""
+        for agent_type in self.list_available_agents():
+            try:
+                self._prompt_cache[agent_type] = self._load_system_prompt(agent_type)
+            except (KeyError, ValueError):
+                # Not a usable prompt file; get_system_prompt raises for this agent only
+                continue
+        try:
+            self._load_agents_metadata()
+        except ValueError:
+            # Left unloaded so the error surfaces when the metadata is requested
+            pass
     
     def get_system_prompt(self, agent_type: str) -> str:
         """
@@ -48,25 +71,26 @@ class PromptManager:
         if agent_type in self._prompt_cache:
             return self._prompt_cache[agent_type]
         
-        # Load prompt from YAML file
+        # Not preloaded (e.g. after clear_cache) - load and cache it now
+        system_prompt = self._load_system_prompt(agent_type)
+        self._prompt_cache[agent_type] = system_prompt
+        return system_prompt
+    
+    def _load_system_prompt(self, agent_type: str) -> str:
+        """Read the system prompt for an agent type from its YAML file."""
         prompt_file = self.prompts_dir / f"{agent_type}.yaml"
         
         if not prompt_file.exists():
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
         
         try:
-            with open(prompt_file, 'r') as f:
-                prompt_data = yaml.safe_load(f)
+            with open(prompt_file, 'rb') as f:
+                prompt_data = yaml.load(f, Loader=SafeLoader)
             
-            if 'system_prompt' not in prompt_data:
+            if not isinstance(prompt_data, dict) or 'system_prompt' not in prompt_data:
                 raise KeyError(f"No 'system_prompt' key found in {prompt_file}")
             
-            system_prompt = prompt_data['system_prompt']
-            
-            # Cache the prompt
-            self._prompt_cache[agent_type] = system_prompt
-            
-            return system_prompt
+            return prompt_data['system_prompt']
             
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {prompt_file}: {e}")
@@ -100,8 +124,8 @@ class PromptManager:
             return self._agents_metadata
         
         try:
-            with open(agents_file, 'r') as f:
-                self._agents_metadata = yaml.safe_load(f)
+            with open(agents_file, 'rb') as f:
+                self._agents_metadata = yaml.load(f, Loader=SafeLoader)
             return self._agents_metadata
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {agents_file}: {e}")
@@ -4,12 +4,60 @@ Tools for data analysis using pandas.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from langchain_core.tools import tool
+from functools import lru_cache
 import io
+import os
+import re
 import sys
+import types
 from contextlib import redirect_stdout, redirect_stderr
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    # pyarrow is optional - fall back to the pandas C parser
+    pa = pc = pacsv = None
+
+# Copy-on-Write lets code executors share cached DataFrames without defensive deep copies.
+# It is always enabled from pandas 3.0, where the option is deprecated.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+# Question keywords for suggest_analysis_steps, matched in a single scan.
+# Group names key into _QUESTION_SUGGESTIONS, whose order is the output order.
+_QUESTION_KEYWORDS = re.compile(
+    r"(?P<correlation>correlation|relationship|relate)|"
+    r"(?P<time>trend|time|date|temporal)|"
+    r"(?P<group>group|category|segment)|"
+    r"(?P<outlier>outlier|anomaly|unusual)|"
+    r"(?P<distribution>distribution|histogram|spread)",
+    re.IGNORECASE
+)
+_QUESTION_SUGGESTIONS = {
+    'correlation': "6. Correlation Analysis: Calculate correlations between numeric variables",
+    'time': "6. Time Series Analysis: Look for date/time columns and analyze trends",
+    'group': "6. Group Analysis: Group data by categorical variables and analyze patterns",
+    'outlier': "6. Outlier Detection: Identify outliers in numeric columns",
+    'distribution': "6. Distribution Analysis: Analyze data distributions and create visualizations",
+}
+
+
+# Strings pd.read_csv treats as missing by default, used for the Arrow CSV reader
+_PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+@lru_cache(maxsize=128)
+def _compile_snippet(code: str) -> types.CodeType:
+    """Compile agent code once; the agent often re-sends identical snippets across turns."""
+    return compile(code, '<agent-exec>', 'exec')
 
 
 # In your tools.py
@@ -132,8 +180,10 @@ class AnalystCodeExecutor:
     """Safe executor for pandas code with the current dataframe."""
     
     def __init__(self, dataframe: pd.DataFrame):
-        self.df = dataframe.copy()
-        self.original_df = dataframe.copy()
+        # Shallow copies are enough: under Copy-on-Write, writes by executed code
+        # copy the affected data and never reach the shared cached frame
+        self.df = dataframe.copy(deep=False)
+        self.original_df = dataframe.copy(deep=False)
     
     def execute_code(self, code: str) -> Dict[str, Any]:
         """Execute pandas code safely and return results."""
@@ -154,9 +204,12 @@ class AnalystCodeExecutor:
             'variables': {}
         }
         try:
+            compiled = _compile_snippet(code)
+            # Always capture stdout: library calls (show_config(), verbose=...) print
+            # without any print/info name appearing in the snippet
             with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
                 # Execute the code
-                exec(code, safe_globals)
+                exec(compiled, safe_globals)
                 
 
                 # Capture any new variables created
@@ -182,6 +235,97 @@ class AnalystCodeExecutor:
         return result
 
 
+def _file_cache_key(file_path: str) -> Tuple[str, int, int]:
+    """Build the (path, mtime, size) key used by the file caches."""
+    stat = os.stat(file_path)
+    return file_path, stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4)
+def _load_dataframe_cached(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a data file; mtime and size are part of the cache key so edits force a reload."""
+    if file_path.lower().endswith('.parquet'):
+        return pd.read_parquet(file_path)
+    if pacsv is None:
+        return pd.read_csv(file_path)
+    try:
+        return _read_csv_arrow(file_path)
+    except pa.ArrowInvalid:
+        # Ragged rows and other input Arrow rejects but pandas tolerates
+        return pd.read_csv(file_path)
+
+
+def _read_csv_arrow(file_path: str) -> pd.DataFrame:
+    """Parse a CSV with Arrow's multithreaded reader, matching what pd.read_csv returns."""
+    # Treat the same tokens as missing as pandas does; empty cells become NaN
+    convert_options = pacsv.ConvertOptions(
+        null_values=_PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    
+    # Arrow infers column types from the first block, so its schema is enough to plan the read
+    with pacsv.open_csv(file_path, convert_options=convert_options) as reader:
+        schema = reader.schema
+    
+    # pandas renames empty ("Unnamed: 0") and duplicated ("a.1") headers;
+    # Arrow reads invalid UTF-8 as binary where pandas reports an encoding error
+    if (
+        '' in schema.names
+        or len(set(schema.names)) != len(schema.names)
+        or any(pa.types.is_binary(field.type) for field in schema)
+    ):
+        return pd.read_csv(file_path)
+    
+    # pandas leaves date-like text as strings, so read inferred date columns as text
+    convert_options.column_types = {
+        field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)
+    }
+    table = pacsv.read_csv(file_path, convert_options=convert_options)
+    
+    # Integers beyond int64 become doubles in Arrow but stay exact (uint64/object) in pandas
+    for column in table.itercolumns():
+        if pa.types.is_floating(column.type) and (pc.max(pc.abs(column)).as_py() or 0) >= 2 ** 63:
+            return pd.read_csv(file_path)
+    
+    dataframe = table.to_pandas()
+    # Arrow fills missing strings and bools with None; pandas uses NaN
+    for field, column in zip(table.schema, table.itercolumns()):
+        if column.null_count and (pa.types.is_string(field.type) or pa.types.is_boolean(field.type)):
+            dataframe[field.name] = dataframe[field.name].where(dataframe[field.name].notna(), np.nan)
+    return dataframe
+
+
+def load_dataframe(file_path: str) -> pd.DataFrame:
+    """
+    Load a data file into a DataFrame, reading .parquet files natively and anything else as CSV.
+    
+    Parsed frames are cached and shared between tool calls, so callers must not
+    modify the returned DataFrame in place.
+    """
+    return _load_dataframe_cached(*_file_cache_key(file_path))
+
+
+@lru_cache(maxsize=4)
+def _split_columns_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Classify the columns of a cached DataFrame once; keyed like _load_dataframe_cached."""
+    dataframe = _load_dataframe_cached(file_path, mtime_ns, size)
+    numeric_cols = tuple(dataframe.select_dtypes(include=[np.number]).columns)
+    categorical_cols = tuple(dataframe.select_dtypes(include=['object', 'category']).columns)
+    return numeric_cols, categorical_cols
+
+
+def load_dataframe_with_columns(file_path: str) -> Tuple[pd.DataFrame, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Load a data file along with its (numeric, categorical) column names, shared across tool calls.
+    
+    The file is stat'ed once, so the column split always belongs to the returned frame
+    even if the file is rewritten concurrently.
+    """
+    cache_key = _file_cache_key(file_path)
+    numeric_cols, categorical_cols = _split_columns_cached(*cache_key)
+    return _load_dataframe_cached(*cache_key), numeric_cols, categorical_cols
+
+
 # @tool
 # def load_csv_file(file_path: str, **kwargs) -> Dict[str, Any]:
 #     """
@@ -243,7 +387,7 @@ def execute_python_code(code: str, csv_file_path: str) -> Dict[str, Any]:
     
     try:
         # Load the dataframe
-        current_dataframe = pd.read_csv(csv_file_path)
+        current_dataframe = load_dataframe(csv_file_path)
         executor = AnalystCodeExecutor(current_dataframe)
     except Exception as e:
         return {
@@ -277,37 +421,43 @@ def get_dataframe_info(csv_file_path: str) -> Dict[str, Any]:
     
     try:
         # Load the dataframe
-        dataframe = pd.read_csv(csv_file_path)
-        # Basic info
+        dataframe, numeric_cols, categorical_cols = load_dataframe_with_columns(csv_file_path)
+        # Basic info (null counts computed once and reused for the percentages)
+        null_counts = dataframe.isnull().sum()
         info = {
             'shape': dataframe.shape,
             'columns': dataframe.columns.tolist(),
-            'dtypes': dataframe.dtypes.to_dict(),
-            'memory_usage_mb': dataframe.memory_usage(deep=True).sum() / 1024 / 1024,
-            'null_counts': dataframe.isnull().sum().to_dict(),
-            'null_percentages': (dataframe.isnull().sum() / len(dataframe) * 100).to_dict(),
+            'dtypes': {col: str(dtype) for col, dtype in dataframe.dtypes.items()},
+            # Shallow count: deep=True would walk every string cell in Python
+            'memory_usage_mb': dataframe.memory_usage(deep=False).sum() / 1024 / 1024,
+            'memory_usage_note': 'shallow (excludes the contents of string/object columns)',
+            'null_counts': null_counts.to_dict(),
+            'null_percentages': (null_counts / len(dataframe) * 100).to_dict(),
         }
         
-        # Statistical summary for numeric columns
-        numeric_cols = dataframe.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) > 0:
-            info['numeric_summary'] = dataframe[numeric_cols].describe().to_dict()
+        # Statistical summary for numeric columns, serialized straight to a JSON string
+        if numeric_cols:
+            info['numeric_summary_json'] = dataframe[list(numeric_cols)].describe().to_json()
         
 
         # Unique value counts for categorical columns
-        categorical_cols = dataframe.select_dtypes(include=['object']).columns
         info['categorical_info'] = {}
         for col in categorical_cols:
-            unique_count = dataframe[col].nunique()
+            # One hashing pass gives both the unique count and the top values
+            value_counts = dataframe[col].value_counts()
+            # Categorical columns also list unused categories, with a count of 0
+            value_counts = value_counts[value_counts > 0]
+            unique_count = len(value_counts)
             if unique_count <= 20:  # Only show value counts for columns with few unique values
                 info['categorical_info'][col] = {
                     'unique_count': unique_count,
-                    'value_counts': dataframe[col].value_counts().head(10).to_dict()
+                    'value_counts': value_counts.head(10).to_dict()
                 }
             else:
+                # value_counts already holds the distinct non-null values, most frequent first
                 info['categorical_info'][col] = {
                     'unique_count': unique_count,
-                    'sample_values': dataframe[col].dropna().unique()[:10].tolist()
+                    'sample_values': value_counts.index[:10].tolist()
                 }
         
         return {
@@ -341,7 +491,7 @@ def suggest_analysis_steps(csv_file_path: str, user_question: str) -> Dict[str,
     
     try:
         # Load the dataframe
-        dataframe = pd.read_csv(csv_file_path)
+        dataframe, numeric_cols, categorical_cols = load_dataframe_with_columns(csv_file_path)
     except Exception as e:
         return {'error': f'Failed to load CSV file: {str(e)}'}
     
@@ -355,31 +505,15 @@ def suggest_analysis_steps(csv_file_path: str, user_question: str) -> Dict[str,
     ])
     
     # Column-specific suggestions
-    numeric_cols = dataframe.select_dtypes(include=[np.number]).columns.tolist()
-    categorical_cols = dataframe.select_dtypes(include=['object']).columns.tolist()
-    
     if numeric_cols:
-        suggestions.append(f"4. Numeric Analysis: Analyze {len(numeric_cols)} numeric columns: {numeric_cols[:3]}...")
+        suggestions.append(f"4. Numeric Analysis: Analyze {len(numeric_cols)} numeric columns: {list(numeric_cols[:3])}...")
     
     if categorical_cols:
-        suggestions.append(f"5. Categorical Analysis: Analyze {len(categorical_cols)} categorical columns: {categorical_cols[:3]}...")
+        suggestions.append(f"5. Categorical Analysis: Analyze {len(categorical_cols)} categorical columns: {list(categorical_cols[:3])}...")
     
     # Question-specific suggestions
-    question_lower = user_question.lower()
-    if any(word in question_lower for word in ['correlation', 'relationship', 'relate']):
-        suggestions.append("6. Correlation Analysis: Calculate correlations between numeric variables")
-    
-    if any(word in question_lower for word in ['trend', 'time', 'date', 'temporal']):
-        suggestions.append("6. Time Series Analysis: Look for date/time columns and analyze trends")
-    
-    if any(word in question_lower for word in ['group', 'category', 'segment']):
-        suggestions.append("6. Group Analysis: Group data by categorical variables and analyze patterns")
-    
-    if any(word in question_lower for word in ['outlier', 'anomaly', 'unusual']):
-        suggestions.append("6. Outlier Detection: Identify outliers in numeric columns")
-    
-    if any(word in question_lower for word in ['distribution', 'histogram', 'spread']):
-        suggestions.append("6. Distribution Analysis: Analyze data distributions and create visualizations")
+    matched = {match.lastgroup for match in _QUESTION_KEYWORDS.finditer(user_question)}
+    suggestions.extend(text for topic, text in _QUESTION_SUGGESTIONS.items() if topic in matched)
     
     return {
         'success': True,